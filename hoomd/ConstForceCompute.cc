@@ -117,6 +117,53 @@ void ConstForceCompute::setParticleForce(unsigned int tag, Scalar fx, Scalar fy,
     m_need_rearrange_forces = true;
     }
 
+/*! \param fx x-components of the force, indexed by particle tag
+    \param fy y-components of the force, indexed by particle tag
+    \param fz z-components of the force, indexed by particle tag
+
+    The force on the particle with tag i is set to (fx[i], fy[i], fz[i]) and its torque is reset to zero, the same as
+    setParticleForce with no torque arguments. The forces are copied into a contiguous buffer indexed by tag, which
+    replaces any previously set array. Forces set earlier with setParticleForce on these tags are discarded, later
+    calls to setParticleForce take precedence.
+*/
+void ConstForceCompute::setForceArray(py::array_t<Scalar, py::array::c_style | py::array::forcecast> fx,
+                                      py::array_t<Scalar, py::array::c_style | py::array::forcecast> fy,
+                                      py::array_t<Scalar, py::array::c_style | py::array::forcecast> fz)
+    {
+    if (fx.ndim() != 1 || fy.ndim() != 1 || fz.ndim() != 1)
+        {
+        m_exec_conf->msg->error() << "Force component arrays must be one dimensional." << std::endl;
+        throw std::runtime_error("Error setting particle forces.\n");
+        }
+
+    if (fx.size() != fy.size() || fx.size() != fz.size())
+        {
+        m_exec_conf->msg->error() << "Force component arrays must have the same length." << std::endl;
+        throw std::runtime_error("Error setting particle forces.\n");
+        }
+
+    const unsigned int n = (unsigned int)fx.size();
+    if (n > 0 && n - 1 > m_pdata->getMaximumTag())
+        {
+        m_exec_conf->msg->error() << "Force component arrays must not be longer than the maximum tag in the system plus one." << std::endl;
+        throw std::runtime_error("Error setting particle forces.\n");
+        }
+
+    const Scalar* h_fx = fx.data();
+    const Scalar* h_fy = fy.data();
+    const Scalar* h_fz = fz.data();
+
+    m_array_forces.resize(n);
+    for (unsigned int tag = 0; tag < n; tag++)
+        m_array_forces[tag] = vec3<Scalar>(h_fx[tag], h_fy[tag], h_fz[tag]);
+
+    // the array overrides per-particle forces previously set on the same tags
+    m_forces.erase(m_forces.begin(), m_forces.lower_bound(n));
+    m_torques.erase(m_torques.begin(), m_torques.lower_bound(n));
+
+    m_need_rearrange_forces = true;
+    }
+
 /*! \param group Group to set the force or torque for
     \param fx x-component of the force
     \param fy y-component of the force
@@ -184,6 +231,25 @@ void ConstForceCompute::rearrangeForces()
         setForce(m_fx, m_fy, m_fz, m_tx, m_ty, m_tz);
         }
 
+    if (m_array_forces.size())
+        {
+        ArrayHandle<Scalar4> h_force(m_force,access_location::host,access_mode::readwrite);
+        ArrayHandle<Scalar4> h_torque(m_torque,access_location::host,access_mode::readwrite);
+        ArrayHandle<unsigned int> h_tag(m_pdata->getTags(), access_location::host, access_mode::read);
+
+        const unsigned int n_array = (unsigned int)m_array_forces.size();
+        for (unsigned int idx = 0; idx < m_pdata->getN(); idx++)
+            {
+            unsigned int tag = h_tag.data[idx];
+            if (tag < n_array)
+                {
+                vec3<Scalar> f = m_array_forces[tag];
+                h_force.data[idx] = make_scalar4(f.x, f.y, f.z, 0);
+                h_torque.data[idx] = make_scalar4(0, 0, 0, 0);
+                }
+            }
+        }
+
     if (m_forces.size())
         {
         assert(m_forces.size() == m_torques.size());
@@ -244,6 +310,7 @@ void export_ConstForceCompute(py::module& m)
     .def("setForce", &ConstForceCompute::setForce)
     .def("setGroupForce", &ConstForceCompute::setGroupForce)
     .def("setParticleForce", &ConstForceCompute::setParticleForce)
+    .def("setForceArray", &ConstForceCompute::setForceArray)
     .def("setCallback", &ConstForceCompute::setCallback)
     ;
     }
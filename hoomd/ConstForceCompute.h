@@ -9,6 +9,7 @@
 
 #include <memory>
 #include <map>
+#include <vector>
 
 /*! \file ConstForceCompute.h
     \brief Declares a class for computing constant forces
@@ -19,6 +20,7 @@
 #endif
 
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 
 #ifndef __CONSTFORCECOMPUTE_H__
 #define __CONSTFORCECOMPUTE_H__
@@ -44,6 +46,11 @@ class PYBIND11_EXPORT ConstForceCompute : public ForceCompute
         //! Set the force for an individual particle
         void setParticleForce(unsigned int tag, Scalar fx, Scalar fy, Scalar fz, Scalar tx=0, Scalar ty=0, Scalar tz=0);
 
+        //! Set the forces for particles 0..N-1 by tag from per-component arrays
+        void setForceArray(pybind11::array_t<Scalar, pybind11::array::c_style | pybind11::array::forcecast> fx,
+                           pybind11::array_t<Scalar, pybind11::array::c_style | pybind11::array::forcecast> fy,
+                           pybind11::array_t<Scalar, pybind11::array::c_style | pybind11::array::forcecast> fz);
+
         //! Set force for a particle group
         void setGroupForce(std::shared_ptr<ParticleGroup> group, Scalar fx, Scalar fy, Scalar fz, Scalar tx=0, Scalar ty=0, Scalar tz=0);
 
@@ -81,6 +88,9 @@ class PYBIND11_EXPORT ConstForceCompute : public ForceCompute
         //! List of particle tags and corresponding forces
         std::map<unsigned int, vec3<Scalar> > m_torques;
 
+        //! Forces set with setForceArray, indexed by particle tag
+        std::vector< vec3<Scalar> > m_array_forces;
+
         //! A python callback when the force is updated
         pybind11::object m_callback;
     };
@@ -93,7 +93,7 @@ void ActiveForceCompute::setActiveForce(const std::string& type_name, pybind11::
 
     if (pybind11::len(v) != 3)
         {
-        throw invalid_argument("gamma_r values must be 3-tuples");
+        throw invalid_argument("active_force values must be 3-tuples");
         }
 
     // check for user errors
@@ -139,7 +139,7 @@ void ActiveForceCompute::setActiveTorque(const std::string& type_name, pybind11:
 
     if (pybind11::len(v) != 3)
         {
-        throw invalid_argument("gamma_r values must be 3-tuples");
+        throw invalid_argument("active_torque values must be 3-tuples");
         }
 
     // check for user errors
@@ -216,12 +216,16 @@ void ActiveForceCompute::setForces()
         unsigned int idx = m_group->getMemberIndex(i);
         unsigned int type = __scalar_as_int(h_pos.data[idx].w);
 
-        vec3<Scalar> f(h_f_actVec.data[type].w*h_f_actVec.data[type].x, h_f_actVec.data[type].w*h_f_actVec.data[type].y, h_f_actVec.data[type].w*h_f_actVec.data[type].z);
+        // load the per-type vectors once instead of re-reading each component
+        const Scalar4 f_act = h_f_actVec.data[type];
+        const Scalar4 t_act = h_t_actVec.data[type];
+
+        vec3<Scalar> f(f_act.w*f_act.x, f_act.w*f_act.y, f_act.w*f_act.z);
         quat<Scalar> quati(h_orientation.data[idx]);
         vec3<Scalar> fi = rotate(quati, f);
         h_force.data[idx] = vec_to_scalar4(fi, 0);
 
-        vec3<Scalar> t(h_t_actVec.data[type].w*h_t_actVec.data[type].x, h_t_actVec.data[type].w*h_t_actVec.data[type].y, h_t_actVec.data[type].w*h_t_actVec.data[type].z);
+        vec3<Scalar> t(t_act.w*t_act.x, t_act.w*t_act.y, t_act.w*t_act.z);
         vec3<Scalar> ti = rotate(quati, t);
         h_torque.data[idx] = vec_to_scalar4(ti, 0);
         }
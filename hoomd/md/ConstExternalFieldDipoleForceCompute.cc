@@ -8,6 +8,8 @@
 #include "ConstExternalFieldDipoleForceCompute.h"
 #include "QuaternionMath.h"
 
+#include <algorithm>
+
 namespace py = pybind11;
 
 using namespace std;
@@ -24,7 +26,7 @@ using namespace std;
     \note This class doesn't actually do anything with the particle data. It just returns a constant force
 */
 ConstExternalFieldDipoleForceCompute::ConstExternalFieldDipoleForceCompute(std::shared_ptr<SystemDefinition> sysdef, Scalar field_x=0.0,Scalar field_y=0.0, Scalar field_z=0.0,Scalar p=0.0)
-        : ForceCompute(sysdef)
+        : ForceCompute(sysdef), m_schedule_started(false), m_schedule_start(0)
     {
     setParams(field_x,field_y,field_z,p);
     }
@@ -40,6 +42,56 @@ ConstExternalFieldDipoleForceCompute::ConstExternalFieldDipoleForceCompute(std::
 void ConstExternalFieldDipoleForceCompute::setParams(Scalar field_x,Scalar field_y, Scalar field_z,Scalar p)
     {
     field=make_scalar4(field_x,field_y,field_z,p);
+
+    // a constant field replaces any schedule
+    m_schedule.clear();
+    m_schedule_started = false;
+    }
+
+/*! \param fields (T,3) array of field components, one row per time step
+    \param p (T,) array of dipole moment magnitudes, one entry per time step
+
+    Row i of the schedule is applied on time step t0 + i, where t0 is the first time step passed to compute() after this call.
+    Once the schedule is exhausted, the last entry remains in effect.
+*/
+void ConstExternalFieldDipoleForceCompute::setParamsSchedule(
+        py::array_t<Scalar, py::array::c_style | py::array::forcecast> fields,
+        py::array_t<Scalar, py::array::c_style | py::array::forcecast> p)
+    {
+    if (fields.ndim() != 2 || fields.shape(1) != 3)
+        throw invalid_argument("fields must be a (T,3) array");
+
+    if (p.ndim() != 1 || p.shape(0) != fields.shape(0))
+        throw invalid_argument("p must be a (T,) array with one entry per row of fields");
+
+    if (p.shape(0) == 0)
+        throw invalid_argument("The field schedule must have at least one entry");
+
+    const Scalar* h_fields = fields.data();
+    const Scalar* h_p = p.data();
+    const unsigned int n = (unsigned int)p.shape(0);
+
+    m_schedule.resize(n);
+    for (unsigned int i = 0; i < n; i++)
+        m_schedule[i] = make_scalar4(h_fields[3*i], h_fields[3*i+1], h_fields[3*i+2], h_p[i]);
+
+    m_schedule_started = false;
+    }
+
+/*! \param timestep Current timestep
+
+    The first time step of a schedule is taken from here rather than from computeForces, so that calls which bypass
+    compute() (such as benchmark) do not shift the schedule.
+*/
+void ConstExternalFieldDipoleForceCompute::compute(unsigned int timestep)
+    {
+    if (!m_schedule.empty() && !m_schedule_started)
+        {
+        m_schedule_start = timestep;
+        m_schedule_started = true;
+        }
+
+    ForceCompute::compute(timestep);
     }
 
 /*! \brief Compute the torque applied = Cross[p,Field]
@@ -47,6 +99,13 @@ void ConstExternalFieldDipoleForceCompute::setParams(Scalar field_x,Scalar field
 */
 void ConstExternalFieldDipoleForceCompute::computeForces(unsigned int timestep)
     {
+    // select the field from the schedule by time step, so repeated computes on the same step apply the same row
+    if (!m_schedule.empty())
+        {
+        size_t i = (m_schedule_started && timestep > m_schedule_start) ? timestep - m_schedule_start : 0;
+        field = m_schedule[std::min(i, m_schedule.size() - 1)];
+        }
+
     // array handles
     ArrayHandle<Scalar4> h_orientation(m_pdata->getOrientationArray(),access_location::host,access_mode::read);
     ArrayHandle<Scalar4> h_torque(m_torque,access_location::host,access_mode::overwrite);
@@ -100,5 +159,6 @@ void export_ConstExternalFieldDipoleForceCompute(py::module& m)
     py::class_< ConstExternalFieldDipoleForceCompute, ForceCompute, std::shared_ptr<ConstExternalFieldDipoleForceCompute> >(m, "ConstExternalFieldDipoleForceCompute")
     .def(py::init< std::shared_ptr<SystemDefinition>, Scalar,Scalar,Scalar,Scalar >())
     .def("setParams", &ConstExternalFieldDipoleForceCompute::setParams)
+    .def("setParamsSchedule", &ConstExternalFieldDipoleForceCompute::setParamsSchedule)
     ;
     }
@@ -7,6 +7,7 @@
 #include "hoomd/ForceCompute.h"
 
 #include <memory>
+#include <vector>
 
 /*! \file ConstExternalFieldDipoleForceCompute.h
     \brief Declares a class for computing external forces on anisotropic particles
@@ -17,6 +18,7 @@
 #endif
 
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 
 #ifndef __CONSTEXTERNALFIELDDIPOLEFORCECOMPUTE_H__
 #define __CONSTEXTERNALFIELDDIPOLEFORCECOMPUTE_H__
@@ -33,12 +35,22 @@ class PYBIND11_EXPORT ConstExternalFieldDipoleForceCompute : public ForceCompute
         //! Set the force to a new value
         void setParams(Scalar field_x,Scalar field_y, Scalar field_z,Scalar p);
 
+        //! Set a schedule of fields and dipole moments, one entry per time step
+        void setParamsSchedule(pybind11::array_t<Scalar, pybind11::array::c_style | pybind11::array::forcecast> fields,
+                               pybind11::array_t<Scalar, pybind11::array::c_style | pybind11::array::forcecast> p);
+
+        //! Compute the forces, recording the first time step of a pending schedule
+        virtual void compute(unsigned int timestep);
+
     protected:
         //! Actually compute the forces
         virtual void computeForces(unsigned int timestep);
 
     private:
     Scalar4 field;  //!< Electric field
+    std::vector<Scalar4> m_schedule;    //!< Fields and dipole moments to apply on successive time steps
+    bool m_schedule_started;            //!< True once the first time step of the schedule is known
+    unsigned int m_schedule_start;      //!< Time step on which the first schedule entry is applied
     };
 
 //! Exports the ConstExternalFieldDipoleForceComputeClass to python
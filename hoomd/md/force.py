@@ -18,12 +18,13 @@ from hoomd.data.typeconverter import OnlyTypes
 from hoomd.data.parameterdicts import ParameterDict, TypeParameterDict
 from hoomd.filter import ParticleFilter
 from hoomd.md.constrain import ConstraintForce
+from hoomd.md.update import constraint_ellipsoid
 
 
 def ellip_preprocessing(constraint):
     if constraint is not None:
-        if (constraint.__class__.__name__ == "constraint_ellipsoid") :
-            return act_force
+        if isinstance(constraint, constraint_ellipsoid):
+            return constraint
         else:
             raise RuntimeError("Active force constraint is not accepted (currently only accepts ellipsoids)")
     else:
@@ -31,7 +32,9 @@ def ellip_preprocessing(constraint):
 
 
 class _force():
-    pass
+    # subclasses must override this to push their coefficients to the c++ class
+    def update_coeffs(self):
+        raise NotImplementedError
 
 
 class Force(_HOOMDBaseObject):
@@ -197,7 +200,7 @@ class constant(Force):
     """
     def setForce(self, fx=None, fy=None, fz=None, fvec=None, tvec=None, group=None, tag=None):
 
-        if (fx is not None) and (fy is not None) and (fx is not None):
+        if (fx is not None) and (fy is not None) and (fz is not None):
             self.fvec = (fx,fy,fz)
         elif fvec is not None:
             self.fvec = fvec
@@ -209,10 +212,9 @@ class constant(Force):
         else:
             self.tvec = (0,0,0)
 
-        if (fvec==(0,0,0)) and (tvec==(0,0,0)):
+        if (self.fvec == (0,0,0)) and (self.tvec == (0,0,0)):
             hoomd.context.current.device.cpp_msg.warning("You are setting the constant force to have no non-zero components\n")
 
-        self.check_initialization()
         if (group is not None):
             self.cppForce.setGroupForce(group.cpp_group, self.fvec[0], self.fvec[1], self.fvec[2],
                                                           self.tvec[0], self.tvec[1], self.tvec[2])
@@ -299,8 +301,9 @@ class Active(Force):
             filter=ParticleFilter,
             seed=int(seed),
             rotation_diff=float(rotation_diff),
-            constraint=OnlyTypes(ConstraintForce, allow_none=True,
-                                preprocess=ellip_preprocessing),
+            constraint=OnlyTypes((ConstraintForce, constraint_ellipsoid),
+                                 allow_none=True,
+                                 preprocess=ellip_preprocessing),
             )
         param_dict.update(dict(constraint=None,
                                rotation_diff=rotation_diff, seed=seed, filter=filter))
@@ -308,9 +311,9 @@ class Active(Force):
         self._param_dict.update(param_dict)
 
         active_force = TypeParameter(
-            'active_force', type_kind='particle_types', param_dict=TypeParameterDict((1, 0, 0), len_keys=1))
+            'active_force', type_kind='particle_types', param_dict=TypeParameterDict((1.0, 0.0, 0.0), len_keys=1))
         active_torque = TypeParameter(
-            'active_torque', type_kind='particle_types', param_dict=TypeParameterDict((0, 0, 0), len_keys=1))
+            'active_torque', type_kind='particle_types', param_dict=TypeParameterDict((0.0, 0.0, 0.0), len_keys=1))
 
         self._extend_typeparam([active_force, active_torque])
 
@@ -335,9 +338,9 @@ class dipole(Force):
     R""" Treat particles as dipoles in an electric field.
 
     Args:
-        field_x (float): x-component of the field (units?)
-        field_y (float): y-component of the field (units?)
-        field_z (float): z-component of the field (units?)
+        field_x (float): x-component of the field (in energy per unit dipole moment)
+        field_y (float): y-component of the field (in energy per unit dipole moment)
+        field_z (float): z-component of the field (in energy per unit dipole moment)
         p (float): magnitude of the particles' dipole moment in the local z direction
 
     Examples::
@@ -360,13 +363,13 @@ class dipole(Force):
         self.field_y = field_y
         self.field_z = field_z
 
-    def set_params(field_x, field_y,field_z,p):
+    def set_params(self, field_x, field_y, field_z, p):
         R""" Change the constant field and dipole moment.
 
         Args:
-            field_x (float): x-component of the field (units?)
-            field_y (float): y-component of the field (units?)
-            field_z (float): z-component of the field (units?)
+            field_x (float): x-component of the field (in energy per unit dipole moment)
+            field_y (float): y-component of the field (in energy per unit dipole moment)
+            field_z (float): z-component of the field (in energy per unit dipole moment)
             p (float): magnitude of the particles' dipole moment in the local z direction
 
         Examples::
@@ -375,8 +378,6 @@ class dipole(Force):
             const_ext_f_dipole.setParams(field_x=0.1, field_y=0.1, field_z=0.0, p=1.0))
 
         """
-        self.check_initialization()
-
         self.cppForce.setParams(field_x,field_y,field_z,p)
 
     # there are no coeffs to update in the constant ExternalFieldDipoleForceCompute
@@ -13,3 +13,29 @@ def test_attach(simulation_factory, two_particle_snapshot_factory):
     sim.operations._schedule()
     sim.run(10)
 
+
+def test_active_vectors_are_floats():
+    active = hoomd.md.force.Active(filter=hoomd.filter.All(),
+                                   seed=2,
+                                   rotation_diff=0.01)
+    active.active_force['A'] = (0.5, 0.25, 0)
+    active.active_torque['A'] = (0, 0, 1.5)
+    assert active.active_force['A'] == (0.5, 0.25, 0.0)
+    assert active.active_torque['A'] == (0.0, 0.0, 1.5)
+    with pytest.raises(hoomd.data.typeconverter.TypeConversionError):
+        active.active_force['A'] = (1.0, 0.0)
+
+
+def test_ellipsoid_constraint():
+
+    class Ellipsoid(hoomd.md.update.constraint_ellipsoid):
+        # skip the legacy constructor, only the type matters here
+        def __init__(self):
+            pass
+
+    active = hoomd.md.force.Active(filter=hoomd.filter.All(),
+                                   seed=2,
+                                   rotation_diff=0.01)
+    ellipsoid = Ellipsoid()
+    active.constraint = ellipsoid
+    assert active.constraint is ellipsoid
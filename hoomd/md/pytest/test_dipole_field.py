@@ -0,0 +1,67 @@
+import hoomd
+from hoomd.md import _md
+import numpy
+import pytest
+
+
+def _expected_torques(field, p, N):
+    # identity orientations put the moment along z, torque = p z x E
+    torque = p * numpy.array([-field[1], field[0], 0.0])
+    return numpy.tile(torque, (N, 1))
+
+
+@pytest.mark.serial
+def test_set_params(simulation_factory, two_particle_snapshot_factory):
+    sim = simulation_factory(two_particle_snapshot_factory())
+    force = _md.ConstExternalFieldDipoleForceCompute(sim.state._cpp_sys_def,
+                                                     0, 0, 0, 0)
+    force.setParams(1.0, 2.0, 0.0, 0.5)
+    force.compute(0)
+    numpy.testing.assert_allclose(force.getTorques(),
+                                  _expected_torques((1.0, 2.0, 0.0), 0.5, 2))
+
+
+@pytest.mark.serial
+def test_set_params_schedule(simulation_factory,
+                             two_particle_snapshot_factory):
+    sim = simulation_factory(two_particle_snapshot_factory())
+    force = _md.ConstExternalFieldDipoleForceCompute(sim.state._cpp_sys_def,
+                                                     0, 0, 0, 0)
+    fields = numpy.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [2.0, 3.0, 0.0]])
+    p = numpy.array([1.0, 2.0, 0.5])
+    force.setParamsSchedule(fields, p)
+
+    # the schedule starts on the first computed step and follows the time step
+    start = 10
+    for i in range(len(p)):
+        force.compute(start + i)
+        numpy.testing.assert_allclose(force.getTorques(),
+                                      _expected_torques(fields[i], p[i], 2))
+
+    # the last row holds after the schedule runs out
+    for step in (start + 3, start + 10):
+        force.compute(step)
+        numpy.testing.assert_allclose(force.getTorques(),
+                                      _expected_torques(fields[-1], p[-1], 2))
+
+    # a constant field clears the schedule
+    force.setParams(0.0, 1.0, 0.0, 1.0)
+    force.compute(start + 11)
+    numpy.testing.assert_allclose(force.getTorques(),
+                                  _expected_torques((0.0, 1.0, 0.0), 1.0, 2))
+
+
+@pytest.mark.serial
+def test_set_params_schedule_errors(simulation_factory,
+                                    two_particle_snapshot_factory):
+    sim = simulation_factory(two_particle_snapshot_factory())
+    force = _md.ConstExternalFieldDipoleForceCompute(sim.state._cpp_sys_def,
+                                                     0, 0, 0, 0)
+    with pytest.raises(ValueError):
+        force.setParamsSchedule(numpy.zeros((3, 2)), numpy.zeros(3))
+
+    with pytest.raises(ValueError):
+        force.setParamsSchedule(numpy.zeros((3, 3)), numpy.zeros(2))
+
+    with pytest.raises(ValueError):
+        force.setParamsSchedule(numpy.zeros((0, 3)), numpy.zeros(0))
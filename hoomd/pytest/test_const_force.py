@@ -0,0 +1,96 @@
+import hoomd
+from hoomd import _hoomd
+import numpy
+import pytest
+
+
+def _make_const_force(sim):
+    return _hoomd.ConstForceCompute(sim.state._cpp_sys_def, 0, 0, 0, 0, 0, 0)
+
+
+@pytest.mark.serial
+def test_set_force_array(simulation_factory, lattice_snapshot_factory):
+    sim = simulation_factory(lattice_snapshot_factory(n=4, r=0.1))
+    N = sim.state.N_particles
+    force = _make_const_force(sim)
+
+    f = numpy.random.uniform(-1, 1, size=(N, 3))
+    force.setParticleForce(0, 0, 0, 0, 1, 2, 3)
+    force.setForceArray(f[:, 0], f[:, 1], f[:, 2])
+    force.compute(0)
+
+    numpy.testing.assert_allclose(force.getForces(), f)
+    # torques are reset, as with setParticleForce
+    numpy.testing.assert_allclose(force.getTorques(), numpy.zeros((N, 3)))
+
+
+@pytest.mark.serial
+def test_set_force_array_partial(simulation_factory,
+                                 lattice_snapshot_factory):
+    sim = simulation_factory(lattice_snapshot_factory(n=4, r=0.1))
+    N = sim.state.N_particles
+    force = _make_const_force(sim)
+
+    force.setForceArray([1.0, 2.0], [0.0, 0.0], [0.0, -1.0])
+    force.compute(0)
+
+    expected = numpy.zeros((N, 3))
+    expected[0] = (1.0, 0.0, 0.0)
+    expected[1] = (2.0, 0.0, -1.0)
+    numpy.testing.assert_allclose(force.getForces(), expected)
+
+
+@pytest.mark.serial
+def test_set_force_array_particle_precedence(simulation_factory,
+                                             lattice_snapshot_factory):
+    sim = simulation_factory(lattice_snapshot_factory(n=4, r=0.1))
+    N = sim.state.N_particles
+    force = _make_const_force(sim)
+
+    f = numpy.random.uniform(-1, 1, size=(N, 3))
+    force.setForceArray(f[:, 0], f[:, 1], f[:, 2])
+    force.setParticleForce(3, 5, 6, 7, 0, 0, 1)
+    force.compute(0)
+
+    f[3] = (5, 6, 7)
+    numpy.testing.assert_allclose(force.getForces(), f)
+    assert tuple(force.getTorques()[3]) == (0, 0, 1)
+
+
+@pytest.mark.serial
+def test_set_force_array_sorted(simulation_factory, lattice_snapshot_factory):
+    sim = simulation_factory(lattice_snapshot_factory(n=4, r=0.1))
+    N = sim.state.N_particles
+    force = _make_const_force(sim)
+
+    f = numpy.random.uniform(-1, 1, size=(N, 3))
+    force.setForceArray(f[:, 0], f[:, 1], f[:, 2])
+    force.compute(0)
+
+    sorter = _hoomd.SFCPackTuner(sim.state._cpp_sys_def,
+                                 hoomd.trigger.Periodic(1))
+    sorter.update(1)
+    force.compute(1)
+
+    numpy.testing.assert_allclose(force.getForces(), f)
+
+
+@pytest.mark.serial
+def test_set_force_array_errors(simulation_factory, lattice_snapshot_factory):
+    sim = simulation_factory(lattice_snapshot_factory(n=4))
+    N = sim.state.N_particles
+    force = _make_const_force(sim)
+
+    # mismatched lengths
+    with pytest.raises(RuntimeError):
+        force.setForceArray(numpy.zeros(N), numpy.zeros(N), numpy.zeros(N - 1))
+
+    # wrong number of dimensions
+    with pytest.raises(RuntimeError):
+        force.setForceArray(numpy.zeros((N, 1)), numpy.zeros((N, 1)),
+                            numpy.zeros((N, 1)))
+
+    # longer than the number of tags
+    with pytest.raises(RuntimeError):
+        force.setForceArray(numpy.zeros(N + 1), numpy.zeros(N + 1),
+                            numpy.zeros(N + 1))